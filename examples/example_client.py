@@ -14,6 +14,7 @@ Usage:
 import asyncio
 import sys
 import os
+from contextlib import AsyncExitStack
 
 # Add parent directory to path if running from examples folder
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -37,51 +38,40 @@ async def main():
     
     print("🚀 Connecting to HiAnime MCP Server...")
     
-    async with stdio_client(server_params) as (read, write):
-        async with ClientSession(read, write) as session:
-            # Initialize the connection
-            await session.initialize()
-            print("✅ Connected successfully!\n")
-            
-            # List available tools
-            tools_response = await session.list_tools()
-            tools = tools_response.tools
-            
-            print(f"📦 Available Tools ({len(tools)}):")
-            print("-" * 50)
-            for tool in tools:
-                print(f"  • {tool.name}: {tool.description[:60]}...")
-            print()
-            
-            # Example 1: Check API health
-            print("🏥 Checking API Health...")
-            health_result = await session.call_tool("check_api_health", arguments={})
-            print(f"   {health_result.content[0].text}\n")
-            
-            # Example 2: Search for anime
-            print("🔍 Searching for 'naruto'...")
-            search_result = await session.call_tool(
+    # Hold transport and session contexts in one AsyncExitStack so they
+    # unwind cleanly together (same pattern works for multiple servers)
+    async with AsyncExitStack() as stack:
+        read, write = await stack.enter_async_context(stdio_client(server_params))
+        session = await stack.enter_async_context(ClientSession(read, write))
+
+        # Initialize the connection
+        await session.initialize()
+        print("✅ Connected successfully!\n")
+
+        # List available tools
+        tools_response = await session.list_tools()
+        tools = tools_response.tools
+
+        print(f"📦 Available Tools ({len(tools)}):")
+        print("-" * 50)
+        for tool in tools:
+            print(f"  • {tool.name}: {tool.description[:60]}...")
+        print()
+
+        # Run the four demo calls concurrently - the stdio transport
+        # multiplexes requests by id, so total time is ~max of the four
+        # roundtrips instead of their sum
+        health_result, search_result, popular_result, filter_result = await asyncio.gather(
+            session.call_tool("check_api_health", arguments={}),
+            session.call_tool(
                 "search_anime",
                 arguments={"keyword": "naruto", "page": 1}
-            )
-            # Print first 500 characters of result
-            result_text = search_result.content[0].text
-            print(result_text[:500] + "..." if len(result_text) > 500 else result_text)
-            print()
-            
-            # Example 3: Get popular anime
-            print("🌟 Getting Popular Anime...")
-            popular_result = await session.call_tool(
+            ),
+            session.call_tool(
                 "get_popular_anime",
                 arguments={"page": 1}
-            )
-            result_text = popular_result.content[0].text
-            print(result_text[:500] + "..." if len(result_text) > 500 else result_text)
-            print()
-            
-            # Example 4: Filter anime
-            print("🎯 Filtering Action Anime with Score >= 8...")
-            filter_result = await session.call_tool(
+            ),
+            session.call_tool(
                 "filter_anime",
                 arguments={
                     "genres": "action",
@@ -89,11 +79,31 @@ async def main():
                     "status": "finished",
                     "page": 1
                 }
-            )
-            result_text = filter_result.content[0].text
-            print(result_text[:500] + "..." if len(result_text) > 500 else result_text)
-            
-            print("\n✨ Demo completed successfully!")
+            ),
+        )
+
+        # Example 1: Check API health
+        print("🏥 API Health:")
+        print(f"   {health_result.content[0].text}\n")
+
+        # Example 2: Search for anime
+        print("🔍 Search Results for 'naruto':")
+        result_text = search_result.content[0].text
+        print(result_text[:500] + "..." if len(result_text) > 500 else result_text)
+        print()
+
+        # Example 3: Get popular anime
+        print("🌟 Popular Anime:")
+        result_text = popular_result.content[0].text
+        print(result_text[:500] + "..." if len(result_text) > 500 else result_text)
+        print()
+
+        # Example 4: Filter anime
+        print("🎯 Action Anime with Score >= 8:")
+        result_text = filter_result.content[0].text
+        print(result_text[:500] + "..." if len(result_text) > 500 else result_text)
+
+        print("\n✨ Demo completed successfully!")
 
 
 if __name__ == "__main__":
@@ -9,16 +9,46 @@ Author: Senior Developer
 Version: 1.0.0
 """
 
+import asyncio
+import atexit
 import logging
 import os
-from typing import Any, Optional
+import random
+import secrets
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import urlencode
 
 import httpx
-from dotenv import load_dotenv
+import ijson
+import orjson
 from mcp.server.fastmcp import FastMCP
 
+
+def _load_env_file(path: str = ".env") -> None:
+    """Load KEY=VALUE pairs from a .env file into os.environ.
+
+    Tiny replacement for python-dotenv so the stdio-spawned server doesn't
+    pay its import cost on every cold start. Existing variables win.
+    """
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+    except OSError:
+        pass
+
+
 # Load environment variables from .env file
-load_dotenv()
+_load_env_file()
 
 # Configure logging to stderr (important for STDIO-based MCP servers)
 logging.basicConfig(
@@ -36,7 +66,7 @@ HIANIME_API_BASE = os.getenv("HIANIME_API_BASE", "https://hianime-api-b6ix.onren
 USER_AGENT = os.getenv("USER_AGENT", "HiAnime-MCP-Server/1.0")
 REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "30.0"))
 
-logger.info(f"Using API base: {HIANIME_API_BASE}")
+logger.info("Using API base: %s", HIANIME_API_BASE)
 
 # Available genres for reference
 AVAILABLE_GENRES = [
@@ -67,79 +97,363 @@ AVAILABLE_SORT_OPTIONS = [
     "name_az", "released_date", "most_watched"
 ]
 
+# Frozenset mirrors of the lists above for O(1) membership checks; the
+# lists are kept for ordered display in error messages
+AVAILABLE_GENRES_SET = frozenset(AVAILABLE_GENRES)
+AVAILABLE_TYPES_SET = frozenset(AVAILABLE_TYPES)
+AVAILABLE_STATUSES_SET = frozenset(AVAILABLE_STATUSES)
+AVAILABLE_RATINGS_SET = frozenset(AVAILABLE_RATINGS)
+AVAILABLE_SEASONS_SET = frozenset(AVAILABLE_SEASONS)
+AVAILABLE_SORT_OPTIONS_SET = frozenset(AVAILABLE_SORT_OPTIONS)
+LANGUAGES_SET = frozenset(("sub", "dub"))
+
+
+@lru_cache(maxsize=256)
+def _norm(value: str, allowed: frozenset) -> Optional[str]:
+    """Normalize user input and validate it against an allowed set.
+
+    Memoized: agent workloads hammer the same few genres/types, so repeat
+    calls skip the lower/strip allocation and the set lookup entirely.
+    Returns the normalized value, or None if it isn't allowed.
+    """
+    normalized = value.strip().casefold()
+    return normalized if normalized in allowed else None
+
+
+# Validation domains keyed by argument kind: (membership set, ordered
+# choices for error messages).  Tools validate through _validate/_invalid
+# instead of repeating the set lookup and message formatting inline
+_FILTER_DOMAINS: dict[str, tuple[frozenset, tuple]] = {
+    "genre": (AVAILABLE_GENRES_SET, tuple(AVAILABLE_GENRES)),
+    "type": (AVAILABLE_TYPES_SET, tuple(AVAILABLE_TYPES)),
+    "status": (AVAILABLE_STATUSES_SET, tuple(AVAILABLE_STATUSES)),
+    "rating": (AVAILABLE_RATINGS_SET, tuple(AVAILABLE_RATINGS)),
+    "season": (AVAILABLE_SEASONS_SET, tuple(AVAILABLE_SEASONS)),
+    "language": (LANGUAGES_SET, ("sub", "dub")),
+    "sort": (AVAILABLE_SORT_OPTIONS_SET, tuple(AVAILABLE_SORT_OPTIONS)),
+}
+
+
+@lru_cache(maxsize=128)
+def _validate(kind: str, value: str) -> Optional[str]:
+    """Validate a tool argument by kind; returns the normalized value or None."""
+    return _norm(value, _FILTER_DOMAINS[kind][0])
+
+
+def _invalid(kind: str, value: str) -> str:
+    """Uniform error message for a rejected tool argument."""
+    return f"Invalid {kind} '{value}'. Available: {', '.join(_FILTER_DOMAINS[kind][1])}"
+
+
+# Shared HTTP client - reused across all requests so keep-alive connections
+# are pooled instead of paying a TCP+TLS handshake per tool call
+CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global CLIENT
+    if CLIENT is None:
+        CLIENT = httpx.AsyncClient(
+            base_url=HIANIME_API_BASE,
+            headers={
+                "User-Agent": USER_AGENT,
+                "Accept": "application/json",
+                # Ask for compressed bodies; httpx decodes transparently
+                "Accept-Encoding": "gzip, deflate",
+            },
+            timeout=REQUEST_TIMEOUT,
+            # HTTP/2 multiplexes concurrent tool calls over one connection
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return CLIENT
+
+
+def _close_client() -> None:
+    """Close the shared client on interpreter shutdown."""
+    if CLIENT is not None:
+        try:
+            asyncio.run(CLIENT.aclose())
+        except Exception:
+            pass
+
+
+atexit.register(_close_client)
+
+# Response cache - every endpoint is a read-only GET, so identical requests
+# within the TTL can be answered from memory without touching the network
+CACHE_TTL = float(os.getenv("CACHE_TTL", "300.0"))
+
+# Per-endpoint TTL overrides: long for slow-moving catalog data, short
+# for freshness-sensitive listings. Anything unlisted uses CACHE_TTL.
+_TTL_OVERRIDES = (
+    ("/api/az", 86400.0),
+    ("/api/genre", 86400.0),
+    ("/api/producer", 86400.0),
+    ("/api/anime/", 3600.0),
+    ("/api/popular", 600.0),
+    ("/api/recently-updated", 60.0),
+)
+_HEALTH_TTL = 30.0
+
+
+class TTLCache:
+    """A small TTL + LRU cache backed by an OrderedDict."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._store: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key, or None if missing/expired."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting LRU entries."""
+        self._store[key] = (time.monotonic() + ttl, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+
+_response_cache = TTLCache(maxsize=512)
+
+# Per-slug {episode number -> episode} index so repeated episode lookups
+# for the same anime skip the O(n) scan over the episode list
+_episode_index_cache = TTLCache(maxsize=128)
+
+# Formatted listing-tool output, keyed by (endpoint, page).  Skips both the
+# fetch and the re-formatting work when the same page is requested again
+# within the window; errors are never cached
+_listing_cache = TTLCache(maxsize=256)
+_LISTING_TTL = 60.0
+
+# In-flight request map so concurrent identical calls share a single fetch
+# (single-flight) instead of hammering the API with duplicates
+_inflight: dict[Any, asyncio.Future] = {}
+
+# Bound outbound concurrency so a burst of tool calls doesn't flood the
+# upstream into 429s (which would cost a full retry cycle each)
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "10"))
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _ttl_for(endpoint: str) -> float:
+    """Pick the cache TTL for an endpoint."""
+    if endpoint == "/":
+        return _HEALTH_TTL
+    for prefix, ttl in _TTL_OVERRIDES:
+        if endpoint.startswith(prefix):
+            return ttl
+    return CACHE_TTL
+
 
 async def make_api_request(endpoint: str, params: Optional[dict] = None) -> dict[str, Any] | None:
-    """Make a request to the HiAnime API with proper error handling."""
-    url = f"{HIANIME_API_BASE}{endpoint}"
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "application/json",
-    }
-    
-    async with httpx.AsyncClient() as client:
+    """Make a request to the HiAnime API with caching and error handling."""
+    key = (endpoint, tuple(sorted((params or {}).items())))
+
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await pending
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    result = None
+    try:
+        result = await _fetch(endpoint, params)
+        if result is not None:
+            _response_cache.set(key, result, _ttl_for(endpoint))
+        return result
+    finally:
+        _inflight.pop(key, None)
+        if not future.done():
+            future.set_result(result)
+
+
+# Retry and circuit-breaker settings for the fetch path. Transient 5xx and
+# timeouts are retried with jittered exponential backoff; after enough
+# consecutive failures the breaker short-circuits requests for a cooldown
+# so a dead backend doesn't cost a full timeout per tool call.
+_MAX_ATTEMPTS = 3
+_RETRY_STATUS_CODES = frozenset((500, 502, 503, 504))
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30.0
+
+_consecutive_failures = 0
+_breaker_open_until = 0.0
+
+
+def _note_failure() -> None:
+    """Record a failed request, opening the circuit breaker if needed."""
+    global _consecutive_failures, _breaker_open_until
+    _consecutive_failures += 1
+    if _consecutive_failures >= _BREAKER_THRESHOLD:
+        _breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN
+        logger.warning(
+            "Circuit breaker opened for %.0fs after %s consecutive failures",
+            _BREAKER_COOLDOWN,
+            _consecutive_failures,
+        )
+
+
+async def _fetch(endpoint: str, params: Optional[dict] = None) -> dict[str, Any] | None:
+    """Perform the actual GET against the HiAnime API with bounded retries."""
+    global _consecutive_failures
+
+    if time.monotonic() < _breaker_open_until:
+        logger.warning("Circuit breaker open, skipping request to %s", endpoint)
+        return None
+
+    client = _get_client()
+    for attempt in range(_MAX_ATTEMPTS):
         try:
-            response = await client.get(
-                url,
-                headers=headers,
-                params=params,
-                timeout=REQUEST_TIMEOUT
-            )
+            async with _request_semaphore:
+                response = await client.get(endpoint, params=params)
             response.raise_for_status()
-            return response.json()
+            logger.debug(
+                "%s response for %s, content-encoding: %s",
+                response.http_version,
+                endpoint,
+                response.headers.get('content-encoding', 'identity'),
+            )
+            _consecutive_failures = 0
+            return orjson.loads(response.content)
         except httpx.TimeoutException:
-            logger.error(f"Request timeout for {url}")
-            return None
+            logger.error("Request timeout for %s (attempt %s)", endpoint, attempt + 1)
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code} for {url}")
-            return None
+            logger.error("HTTP error %s for %s", e.response.status_code, endpoint)
+            if e.response.status_code not in _RETRY_STATUS_CODES:
+                # Client errors mean this request was wrong, not that the
+                # backend is unhealthy - don't count them toward the breaker
+                return None
         except Exception as e:
-            logger.error(f"Request failed for {url}: {str(e)}")
+            logger.error("Request failed for %s: %s", endpoint, e)
+            _note_failure()
             return None
 
+        if attempt + 1 < _MAX_ATTEMPTS:
+            # 100ms -> 400ms base, with +/-50% jitter
+            await asyncio.sleep(0.1 * (4 ** attempt) * random.uniform(0.5, 1.5))
+
+    _note_failure()
+    return None
+
+
+class _AsyncByteReader:
+    """Minimal async file-like adapter over an httpx byte iterator for ijson."""
+
+    def __init__(self, aiter: AsyncIterator[bytes]):
+        self._aiter = aiter
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes with read(0) to sniff bytes vs str; don't
+            # consume a chunk for it
+            return b""
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def make_api_request_stream(
+    endpoint: str,
+    params: Optional[dict] = None,
+    items_path: str = "data.item",
+) -> AsyncIterator[dict]:
+    """Stream items from a large list endpoint without buffering the body.
+
+    Decodes the response incrementally with ijson, yielding one item at a
+    time so formatting can begin before the full payload has arrived and
+    peak memory stays at O(1 item). Raises httpx.HTTPError on failure.
+    """
+    client = _get_client()
+    # Hold the semaphore for the duration of the stream: the connection
+    # is live the whole time, so it counts against outbound concurrency
+    # just like a buffered fetch
+    async with _request_semaphore:
+        async with client.stream("GET", endpoint, params=params) as response:
+            response.raise_for_status()
+            reader = _AsyncByteReader(response.aiter_bytes())
+            async for item in ijson.items(reader, items_path):
+                yield item
+
+
+# Separator line used under every tool's result header
+_SEP = "=" * 50 + "\n"
+
+# Pre-built template for a single anime listing entry; filled via
+# format_map so the literal isn't rebuilt per item
+_ITEM_TMPL = """
+📺 **{title}**
+   ▸ Slug: `{slug}` ← Use this for episode lookup
+   ▸ Type: {type}
+   ▸ Episodes: {eps}
+   ▸ Duration: {duration}"""
+
 
 def format_anime_item(item: dict) -> str:
     """Format a single anime item into a readable string."""
+    get = item.get
+
     # Extract slug properly - prefer 'slug' field, fallback to constructing from id
-    slug = item.get('slug', '')
-    url = item.get('url', '')
-    if not slug and item.get('id'):
-        # Try to extract from URL if available
-        if url:
-            # URL format: https://hianime.to/anime-name-123?ref=search
-            path = url.split('?')[0].split('/')[-1]
-            slug = path
-        else:
-            slug = item.get('id', 'N/A')
-    
-    # Clean URL (remove ref param)
+    slug = get('slug', '')
+    url = get('url', '')
     if url:
-        url = url.split('?')[0]
-    
-    # Get episode counts
-    eps_sub = item.get('episodes_sub', item.get('episodes', {}).get('sub', 'N/A'))
-    eps_dub = item.get('episodes_dub', item.get('episodes', {}).get('dub', 'N/A'))
-    eps_display = f"Sub: {eps_sub}"
-    if eps_dub:
-        eps_display += f", Dub: {eps_dub}"
-    
-    result = f"""
-📺 **{item.get('title', 'Unknown Title')}**
-   ▸ Slug: `{slug}` ← Use this for episode lookup
-   ▸ Type: {item.get('type', 'N/A')}
-   ▸ Episodes: {eps_display}
-   ▸ Duration: {item.get('duration', 'N/A')}"""
-    
+        # Strip the query and derive the slug fallback with plain string
+        # splits - cheaper than a full URL parse for this shape
+        # (URL format: https://hianime.to/anime-name-123?ref=search)
+        url = url.partition('?')[0]
+        if not slug and get('id'):
+            slug = url.rpartition('/')[2]
+    elif not slug and get('id'):
+        slug = get('id', 'N/A')
+
+    # Get episode counts - probe the nested 'episodes' dict only once
+    eps = get('episodes') or {}
+    eps_sub = get('episodes_sub', eps.get('sub', 'N/A'))
+    eps_dub = get('episodes_dub', eps.get('dub', 'N/A'))
+    eps_display = f"Sub: {eps_sub}, Dub: {eps_dub}" if eps_dub else f"Sub: {eps_sub}"
+
+    text = _ITEM_TMPL.format_map({
+        "title": get('title', 'Unknown Title'),
+        "slug": slug,
+        "type": get('type', 'N/A'),
+        "eps": eps_display,
+        "duration": get('duration', 'N/A'),
+    })
+
     if url:
-        result += f"\n   ▸ Page: {url}"
-    
-    return result
+        return f"{text}\n   ▸ Page: {url}"
+    return text
 
 
 def format_anime_list(data: list[dict]) -> str:
     """Format a list of anime items."""
     if not data:
         return "No anime found."
-    return "\n".join(format_anime_item(item) for item in data)
+    return "\n".join([format_anime_item(item) for item in data])
+
+
+async def format_anime_list_stream(items: AsyncIterator[dict]) -> tuple[int, str]:
+    """Format a stream of anime items, returning (count, formatted text)."""
+    parts = [format_anime_item(item) async for item in items]
+    if not parts:
+        return 0, "No anime found."
+    return len(parts), "\n".join(parts)
 
 
 def format_anime_details(data: dict) -> str:
@@ -148,67 +462,111 @@ def format_anime_details(data: dict) -> str:
     
     # Handle nested structure
     anime_info = info.get('anime', info)
-    
-    details = f"""
-🎬 **{anime_info.get('title', 'Unknown Title')}**
+
+    # Fetch each field once into locals so the template below does no
+    # repeated dict probing or eager fallback lookups
+    title = anime_info.get('title', 'Unknown Title')
+    japanese_title = anime_info.get('japanese_title') or anime_info.get('japaneseTitle') or 'N/A'
+    anime_type = anime_info.get('type', 'N/A')
+    status = anime_info.get('status', 'N/A')
+    episodes = anime_info.get('episodes') or anime_info.get('totalEpisodes') or 'N/A'
+    duration = anime_info.get('duration', 'N/A')
+    aired = anime_info.get('aired', 'N/A')
+    season = anime_info.get('season', 'N/A')
+    rating = anime_info.get('rating') or anime_info.get('malscore') or 'N/A'
+    synopsis = anime_info.get('synopsis') or anime_info.get('description') or 'No synopsis available.'
+    genres = ', '.join(anime_info.get('genres') or ()) or 'N/A'
+    studios = ', '.join(anime_info.get('studios') or ()) or 'N/A'
+    producers = ', '.join(anime_info.get('producers') or ()) or 'N/A'
+
+    return f"""
+🎬 **{title}**
 
 📝 **Basic Information:**
-   - Japanese Title: {anime_info.get('japanese_title', anime_info.get('japaneseTitle', 'N/A'))}
-   - Type: {anime_info.get('type', 'N/A')}
-   - Status: {anime_info.get('status', 'N/A')}
-   - Episodes: {anime_info.get('episodes', anime_info.get('totalEpisodes', 'N/A'))}
-   - Duration: {anime_info.get('duration', 'N/A')}
-   - Aired: {anime_info.get('aired', 'N/A')}
-   - Season: {anime_info.get('season', 'N/A')}
-   - Rating: {anime_info.get('rating', anime_info.get('malscore', 'N/A'))}
+   - Japanese Title: {japanese_title}
+   - Type: {anime_type}
+   - Status: {status}
+   - Episodes: {episodes}
+   - Duration: {duration}
+   - Aired: {aired}
+   - Season: {season}
+   - Rating: {rating}
 
 📖 **Synopsis:**
-{anime_info.get('synopsis', anime_info.get('description', 'No synopsis available.'))}
+{synopsis}
 
-🏷️ **Genres:** {', '.join(anime_info.get('genres', [])) if anime_info.get('genres') else 'N/A'}
+🏷️ **Genres:** {genres}
 
-🎭 **Studios:** {', '.join(anime_info.get('studios', [])) if anime_info.get('studios') else 'N/A'}
+🎭 **Studios:** {studios}
 
-�icing **Producers:** {', '.join(anime_info.get('producers', [])) if anime_info.get('producers') else 'N/A'}
+�icing **Producers:** {producers}
 """
-    return details
+
+
+_FILLER_SUFFIX = " 🔸 Filler"
 
 
 def format_episode_list(data: list[dict], include_urls: bool = True) -> str:
     """Format episode list with reference links."""
     if not data:
         return "No episodes found."
-    
-    episodes = []
-    for ep in data[:20]:  # Limit to first 20 episodes for readability
-        ep_num = ep.get('number', ep.get('episodeNum', 'N/A'))
-        title = ep.get('title', ep.get('name', 'N/A'))
-        japanese_title = ep.get('japanese_title', '')
-        ep_id = ep.get('id', '')
-        url = ep.get('url', '')
-        is_filler = " 🔸 Filler" if ep.get('is_filler', ep.get('isFiller', False)) else ""
-        
-        ep_line = f"   Episode {ep_num}: {title}"
+
+    # Pre-sized output list plus a local ep.get alias keep the inner loop
+    # tight; optional fields are only fetched when they can be shown
+    episodes = [""] * min(len(data), 20)
+    for i, ep in enumerate(islice(data, 20)):  # Limit to first 20 episodes for readability
+        get = ep.get
+        ep_num = get('number', get('episodeNum', 'N/A'))
+        title = get('title', get('name', 'N/A'))
+
+        parts = [f"   Episode {ep_num}: {title}"]
+        japanese_title = get('japanese_title')
         if japanese_title:
-            ep_line += f" ({japanese_title})"
-        ep_line += is_filler
-        if include_urls and url:
-            ep_line += f"\n      📎 Reference: {url}"
+            parts.append(f" ({japanese_title})")
+        if get('is_filler') or get('isFiller'):
+            parts.append(_FILLER_SUFFIX)
+        if include_urls:
+            url = get('url')
+            if url:
+                parts.append(f"\n      📎 Reference: {url}")
+        ep_id = get('id')
         if ep_id:
-            ep_line += f"\n      🆔 ID: {ep_id}"
-        
-        episodes.append(ep_line)
-    
-    result = "\n\n".join(episodes)
-    if len(data) > 20:
-        result += f"\n\n... and {len(data) - 20} more episodes."
-    return result
+            parts.append(f"\n      🆔 ID: {ep_id}")
+
+        episodes[i] = "".join(parts)
+
+    tail = f"\n\n... and {len(data) - 20} more episodes." if len(data) > 20 else ""
+    return "\n\n".join(episodes) + tail
 
 
 # ============================================================================
 # MCP TOOLS
 # ============================================================================
 
+async def _listing(endpoint: str, page: int, header: str, fail_msg: str) -> str:
+    """Shared fetch-check-format path for the paginated listing tools."""
+    cache_key = (endpoint, page)
+    cached = _listing_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    data = await make_api_request(endpoint, {"page": page})
+
+    if not data or not data.get("success"):
+        return fail_msg
+
+    anime_list = data.get("data", [])
+    count = data.get("count", len(anime_list))
+
+    result = "".join((
+        f"{header} (Page {page}, {count} results)\n",
+        _SEP,
+        format_anime_list(anime_list),
+    ))
+    _listing_cache.set(cache_key, result, _LISTING_TTL)
+    return result
+
+
 @mcp.tool()
 async def search_anime(keyword: str, page: int = 1) -> str:
     """
@@ -221,7 +579,7 @@ async def search_anime(keyword: str, page: int = 1) -> str:
     Returns:
         A formatted list of anime matching the search query
     """
-    logger.info(f"Searching anime with keyword: {keyword}, page: {page}")
+    logger.info("Searching anime with keyword: %s, page: %s", keyword, page)
     
     data = await make_api_request("/api/search", {"keyword": keyword, "page": page})
     
@@ -235,11 +593,61 @@ async def search_anime(keyword: str, page: int = 1) -> str:
     if not anime_list:
         return f"No anime found for '{keyword}'."
     
-    result = f"🔍 **Search Results for '{keyword}'** (Page {current_page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return "".join((f"🔍 **Search Results for '{keyword}'** (Page {current_page}, {count} results)\n", _SEP, format_anime_list(anime_list)))
+
+
+def _anime_record(item: dict) -> dict:
+    """Reduce an anime item to its structured fields for NDJSON output."""
+    slug = item.get('slug', '')
+    url = item.get('url', '')
+    if url:
+        url = url.partition('?')[0]
+        if not slug and item.get('id'):
+            slug = url.rpartition('/')[2]
+    elif not slug:
+        slug = item.get('id', '')
+
+    eps = item.get('episodes') or {}
+    return {
+        "title": item.get('title'),
+        "slug": slug,
+        "type": item.get('type'),
+        "eps_sub": item.get('episodes_sub', eps.get('sub')),
+        "eps_dub": item.get('episodes_dub', eps.get('dub')),
+        "url": url or None,
+    }
+
+
+@mcp.tool()
+async def search_anime_ndjson(keyword: str, page: int = 1) -> str:
+    """
+    Search for anime by keyword, returning compact JSON Lines.
+
+    Emits one JSON object per line with just the structured fields
+    (title, slug, type, eps_sub, eps_dub, url) - far fewer bytes and
+    tokens than the decorated output of search_anime, and trivially
+    parseable line by line.
+
+    Args:
+        keyword: The search term to find anime (e.g., "naruto", "one piece")
+        page: Page number for pagination (default: 1)
+
+    Returns:
+        Newline-delimited JSON, one anime per line
+    """
+    logger.info("Searching anime (ndjson) with keyword: %s, page: %s", keyword, page)
+
+    data = await make_api_request("/api/search", {"keyword": keyword, "page": page})
+
+    if not data or not data.get("success"):
+        return f"Unable to search for '{keyword}'. Please try again later."
+
+    anime_list = data.get("data", [])
+
+    if not anime_list:
+        return f"No anime found for '{keyword}'."
+
+    return "\n".join([orjson.dumps(_anime_record(item)).decode() for item in anime_list])
 
 
 @mcp.tool()
@@ -253,21 +661,10 @@ async def get_popular_anime(page: int = 1) -> str:
     Returns:
         A formatted list of popular anime
     """
-    logger.info(f"Fetching popular anime, page: {page}")
+    logger.info("Fetching popular anime, page: %s", page)
     
-    data = await make_api_request("/api/popular", {"page": page})
-    
-    if not data or not data.get("success"):
-        return "Unable to fetch popular anime. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"🌟 **Most Popular Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return await _listing("/api/popular", page, "🌟 **Most Popular Anime**",
+                          "Unable to fetch popular anime. Please try again later.")
 
 
 @mcp.tool()
@@ -281,21 +678,10 @@ async def get_top_airing_anime(page: int = 1) -> str:
     Returns:
         A formatted list of currently airing anime
     """
-    logger.info(f"Fetching top airing anime, page: {page}")
+    logger.info("Fetching top airing anime, page: %s", page)
     
-    data = await make_api_request("/api/top-airing", {"page": page})
-    
-    if not data or not data.get("success"):
-        return "Unable to fetch top airing anime. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"📡 **Currently Airing Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return await _listing("/api/top-airing", page, "📡 **Currently Airing Anime**",
+                          "Unable to fetch top airing anime. Please try again later.")
 
 
 @mcp.tool()
@@ -309,21 +695,10 @@ async def get_recently_updated_anime(page: int = 1) -> str:
     Returns:
         A formatted list of recently updated anime
     """
-    logger.info(f"Fetching recently updated anime, page: {page}")
-    
-    data = await make_api_request("/api/recently-updated", {"page": page})
+    logger.info("Fetching recently updated anime, page: %s", page)
     
-    if not data or not data.get("success"):
-        return "Unable to fetch recently updated anime. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"🆕 **Recently Updated Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return await _listing("/api/recently-updated", page, "🆕 **Recently Updated Anime**",
+                          "Unable to fetch recently updated anime. Please try again later.")
 
 
 @mcp.tool()
@@ -337,21 +712,10 @@ async def get_completed_anime(page: int = 1) -> str:
     Returns:
         A formatted list of completed anime
     """
-    logger.info(f"Fetching completed anime, page: {page}")
-    
-    data = await make_api_request("/api/completed", {"page": page})
+    logger.info("Fetching completed anime, page: %s", page)
     
-    if not data or not data.get("success"):
-        return "Unable to fetch completed anime. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"✅ **Completed Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return await _listing("/api/completed", page, "✅ **Completed Anime**",
+                          "Unable to fetch completed anime. Please try again later.")
 
 
 @mcp.tool()
@@ -365,21 +729,10 @@ async def get_subbed_anime(page: int = 1) -> str:
     Returns:
         A formatted list of subbed anime
     """
-    logger.info(f"Fetching subbed anime, page: {page}")
-    
-    data = await make_api_request("/api/subbed", {"page": page})
+    logger.info("Fetching subbed anime, page: %s", page)
     
-    if not data or not data.get("success"):
-        return "Unable to fetch subbed anime. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"📝 **Subbed Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return await _listing("/api/subbed", page, "📝 **Subbed Anime**",
+                          "Unable to fetch subbed anime. Please try again later.")
 
 
 @mcp.tool()
@@ -393,21 +746,10 @@ async def get_dubbed_anime(page: int = 1) -> str:
     Returns:
         A formatted list of dubbed anime
     """
-    logger.info(f"Fetching dubbed anime, page: {page}")
-    
-    data = await make_api_request("/api/dubbed", {"page": page})
+    logger.info("Fetching dubbed anime, page: %s", page)
     
-    if not data or not data.get("success"):
-        return "Unable to fetch dubbed anime. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"🎙️ **Dubbed Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return await _listing("/api/dubbed", page, "🎙️ **Dubbed Anime**",
+                          "Unable to fetch dubbed anime. Please try again later.")
 
 
 @mcp.tool()
@@ -427,26 +769,18 @@ async def get_anime_by_genre(genre: str, page: int = 1) -> str:
     Returns:
         A formatted list of anime in the specified genre
     """
-    genre_lower = genre.lower().strip()
-    
-    if genre_lower not in AVAILABLE_GENRES:
-        return f"Invalid genre '{genre}'. Available genres: {', '.join(AVAILABLE_GENRES)}"
-    
-    logger.info(f"Fetching anime by genre: {genre_lower}, page: {page}")
-    
-    data = await make_api_request(f"/api/genre/{genre_lower}", {"page": page})
-    
-    if not data or not data.get("success"):
-        return f"Unable to fetch anime for genre '{genre}'. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
+    genre_lower = _validate("genre", genre)
+
+    if genre_lower is None:
+        return _invalid("genre", genre)
     
-    result = f"🏷️ **{genre.title()} Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
+    logger.info("Fetching anime by genre: %s, page: %s", genre_lower, page)
     
-    return result
+    # Header must come from the normalized value: the formatted output is
+    # cached by (endpoint, page), so raw input like " ACTION " would
+    # otherwise be baked into the entry served to later callers
+    return await _listing(f"/api/genre/{genre_lower}", page, f"🏷️ **{genre_lower.title()} Anime**",
+                          f"Unable to fetch anime for genre '{genre}'. Please try again later.")
 
 
 @mcp.tool()
@@ -461,26 +795,15 @@ async def get_anime_by_type(anime_type: str, page: int = 1) -> str:
     Returns:
         A formatted list of anime of the specified type
     """
-    type_lower = anime_type.lower().strip()
-    
-    if type_lower not in AVAILABLE_TYPES:
-        return f"Invalid type '{anime_type}'. Available types: {', '.join(AVAILABLE_TYPES)}"
-    
-    logger.info(f"Fetching anime by type: {type_lower}, page: {page}")
-    
-    data = await make_api_request(f"/api/type/{type_lower}", {"page": page})
-    
-    if not data or not data.get("success"):
-        return f"Unable to fetch anime for type '{anime_type}'. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
+    type_lower = _validate("type", anime_type)
+
+    if type_lower is None:
+        return _invalid("type", anime_type)
     
-    result = f"📁 **{anime_type.upper()} Anime** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
+    logger.info("Fetching anime by type: %s, page: %s", type_lower, page)
     
-    return result
+    return await _listing(f"/api/type/{type_lower}", page, f"📁 **{type_lower.upper()} Anime**",
+                          f"Unable to fetch anime for type '{anime_type}'. Please try again later.")
 
 
 @mcp.tool()
@@ -495,7 +818,7 @@ async def get_anime_details(slug: str) -> str:
     Returns:
         Detailed information about the anime including synopsis, genres, status, etc.
     """
-    logger.info(f"Fetching anime details for slug: {slug}")
+    logger.info("Fetching anime details for slug: %s", slug)
     
     data = await make_api_request(f"/api/anime/{slug}")
     
@@ -505,33 +828,88 @@ async def get_anime_details(slug: str) -> str:
     return format_anime_details(data)
 
 
+async def _get_episodes(slug: str) -> Optional[tuple[list[dict], dict]]:
+    """Fetch the episode list for a slug plus a {number: episode} index.
+
+    Both are cached together so get_anime_episodes and get_episode_info
+    share one fetch, and sequential episode lookups stay O(1).
+    Returns None when the API call fails.
+    """
+    cached = _episode_index_cache.get(slug)
+    if cached is not None:
+        return cached
+
+    data = await make_api_request(f"/api/episodes/{slug}")
+
+    if not data or not data.get("success"):
+        return None
+
+    episodes = data.get("data", [])
+    entry = (episodes, {ep.get('number'): ep for ep in episodes})
+    _episode_index_cache.set(slug, entry, CACHE_TTL)
+    return entry
+
+
 @mcp.tool()
 async def get_anime_episodes(slug: str) -> str:
     """
     Get the episode list for a specific anime.
-    
+
     Args:
         slug: The anime slug/ID (e.g., "naruto-677", "one-piece-100").
               You can get the slug from search results or browse listings.
-    
+
     Returns:
         A list of episodes for the anime
     """
-    logger.info(f"Fetching episodes for anime: {slug}")
-    
-    data = await make_api_request(f"/api/episodes/{slug}")
-    
-    if not data or not data.get("success"):
+    logger.info("Fetching episodes for anime: %s", slug)
+
+    entry = await _get_episodes(slug)
+
+    if entry is None:
         return f"Unable to fetch episodes for anime '{slug}'. Please check the slug and try again."
-    
-    episodes = data.get("data", [])
-    count = data.get("count", len(episodes))
-    
-    result = f"📺 **Episodes for {slug}** ({count} total episodes)\n"
-    result += "=" * 50 + "\n"
-    result += format_episode_list(episodes)
-    
-    return result
+
+    episodes, _ = entry
+
+    return "".join((f"📺 **Episodes for {slug}** ({len(episodes)} total episodes)\n", _SEP, format_episode_list(episodes)))
+
+
+@mcp.tool()
+async def get_anime_overview(slug: str) -> str:
+    """
+    Get detailed information and the episode list for an anime in one call.
+
+    Fetches /api/anime/{slug} and /api/episodes/{slug} concurrently, so it
+    costs about as much wall time as the slower of the two.
+
+    Args:
+        slug: The anime slug/ID (e.g., "naruto-677", "one-piece-100")
+
+    Returns:
+        The anime details followed by its episode list
+    """
+    logger.info("Fetching overview for anime: %s", slug)
+
+    details_data, episodes_entry = await asyncio.gather(
+        make_api_request(f"/api/anime/{slug}"),
+        _get_episodes(slug),
+        return_exceptions=True,
+    )
+
+    parts = []
+
+    if isinstance(details_data, BaseException) or not details_data or not details_data.get("success"):
+        parts.append(f"Unable to fetch details for anime '{slug}'. Please check the slug and try again.")
+    else:
+        parts.append(format_anime_details(details_data))
+
+    if isinstance(episodes_entry, BaseException) or episodes_entry is None:
+        parts.append(f"Unable to fetch episodes for anime '{slug}'.")
+    else:
+        episodes, _ = episodes_entry
+        parts.append(f"📺 **Episodes** ({len(episodes)} total)\n" + _SEP + format_episode_list(episodes))
+
+    return "\n".join(parts)
 
 
 @mcp.tool()
@@ -546,24 +924,18 @@ async def get_episode_info(slug: str, episode_number: int) -> str:
     Returns:
         Episode details including title, ID, and reference page
     """
-    logger.info(f"Getting info for {slug} episode {episode_number}")
-    
-    data = await make_api_request(f"/api/episodes/{slug}")
-    
-    if not data or not data.get("success"):
+    logger.info("Getting info for %s episode %s", slug, episode_number)
+
+    entry = await _get_episodes(slug)
+
+    if entry is None:
         return f"Unable to fetch episodes for anime '{slug}'. Please check the slug and try again."
-    
-    episodes = data.get("data", [])
-    
-    # Find the specific episode
-    episode = None
-    for ep in episodes:
-        if ep.get('number') == episode_number:
-            episode = ep
-            break
-    
+
+    _, index = entry
+    episode = index.get(episode_number)
+
     if not episode:
-        return f"Episode {episode_number} not found for '{slug}'. This anime has {len(episodes)} episodes (1-{len(episodes)})."
+        return f"Episode {episode_number} not found for '{slug}'. This anime has {len(index)} episodes (1-{len(index)})."
     
     title = episode.get('title', 'N/A')
     japanese_title = episode.get('japanese_title', '')
@@ -603,21 +975,27 @@ async def get_anime_az_list(letter: str, page: int = 1) -> str:
     
     letter_param = letter.lower() if letter_upper == "OTHER" else letter_upper
     
-    logger.info(f"Fetching A-Z list for letter: {letter_param}, page: {page}")
-    
-    data = await make_api_request(f"/api/az/{letter_param}", {"page": page})
-    
-    if not data or not data.get("success"):
+    logger.info("Fetching A-Z list for letter: %s, page: %s", letter_param, page)
+
+    # A-Z pages can be very large, so stream-parse instead of buffering
+    try:
+        count, listing = await format_anime_list_stream(
+            make_api_request_stream(f"/api/az/{letter_param}", {"page": page})
+        )
+    except httpx.HTTPError as e:
+        logger.error("Request failed for /api/az/%s: %s", letter_param, e)
         return f"Unable to fetch anime for letter '{letter}'. Please try again later."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"🔤 **Anime Starting with '{letter_upper}'** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+
+    if count == 0:
+        # The item stream never sees the response envelope, so an empty
+        # stream can be either a truly empty page or a success=false
+        # body.  Confirm through the cached request path, which also
+        # applies the /api/az TTL override and retry/breaker handling
+        data = await make_api_request(f"/api/az/{letter_param}", {"page": page})
+        if not data or not data.get("success"):
+            return f"Unable to fetch anime for letter '{letter}'. Please try again later."
+
+    return "".join((f"🔤 **Anime Starting with '{letter_upper}'** (Page {page}, {count} results)\n", _SEP, listing))
 
 
 @mcp.tool()
@@ -633,21 +1011,10 @@ async def get_anime_by_producer(producer_slug: str, page: int = 1) -> str:
     Returns:
         A formatted list of anime from the specified producer/studio
     """
-    logger.info(f"Fetching anime by producer: {producer_slug}, page: {page}")
+    logger.info("Fetching anime by producer: %s, page: %s", producer_slug, page)
     
-    data = await make_api_request(f"/api/producer/{producer_slug}", {"page": page})
-    
-    if not data or not data.get("success"):
-        return f"Unable to fetch anime for producer '{producer_slug}'. Please check the producer slug and try again."
-    
-    anime_list = data.get("data", [])
-    count = data.get("count", len(anime_list))
-    
-    result = f"🏢 **Anime by {producer_slug.replace('-', ' ').title()}** (Page {page}, {count} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return await _listing(f"/api/producer/{producer_slug}", page, f"🏢 **Anime by {producer_slug.replace('-', ' ').title()}**",
+                          f"Unable to fetch anime for producer '{producer_slug}'. Please check the producer slug and try again.")
 
 
 @mcp.tool()
@@ -684,21 +1051,24 @@ async def filter_anime(
     filters_applied = []
     
     if anime_type:
-        if anime_type.lower() not in AVAILABLE_TYPES:
-            return f"Invalid type '{anime_type}'. Available: {', '.join(AVAILABLE_TYPES)}"
-        params["type"] = anime_type.lower()
+        type_value = _validate("type", anime_type)
+        if type_value is None:
+            return _invalid("type", anime_type)
+        params["type"] = type_value
         filters_applied.append(f"Type: {anime_type}")
-    
+
     if status:
-        if status.lower() not in AVAILABLE_STATUSES:
-            return f"Invalid status '{status}'. Available: {', '.join(AVAILABLE_STATUSES)}"
-        params["status"] = status.lower()
+        status_value = _validate("status", status)
+        if status_value is None:
+            return _invalid("status", status)
+        params["status"] = status_value
         filters_applied.append(f"Status: {status}")
-    
+
     if rated:
-        if rated.lower() not in AVAILABLE_RATINGS:
-            return f"Invalid rating '{rated}'. Available: {', '.join(AVAILABLE_RATINGS)}"
-        params["rated"] = rated.lower()
+        rated_value = _validate("rating", rated)
+        if rated_value is None:
+            return _invalid("rating", rated)
+        params["rated"] = rated_value
         filters_applied.append(f"Rated: {rated}")
     
     if score is not None:
@@ -708,15 +1078,17 @@ async def filter_anime(
         filters_applied.append(f"Min Score: {score}")
     
     if season:
-        if season.lower() not in AVAILABLE_SEASONS:
-            return f"Invalid season '{season}'. Available: {', '.join(AVAILABLE_SEASONS)}"
-        params["season"] = season.lower()
+        season_value = _validate("season", season)
+        if season_value is None:
+            return _invalid("season", season)
+        params["season"] = season_value
         filters_applied.append(f"Season: {season}")
-    
+
     if language:
-        if language.lower() not in ["sub", "dub"]:
-            return "Invalid language. Available: sub, dub"
-        params["language"] = language.lower()
+        language_value = _validate("language", language)
+        if language_value is None:
+            return _invalid("language", language)
+        params["language"] = language_value
         filters_applied.append(f"Language: {language}")
     
     if genres:
@@ -724,12 +1096,13 @@ async def filter_anime(
         filters_applied.append(f"Genres: {genres}")
     
     if sort:
-        if sort.lower() not in AVAILABLE_SORT_OPTIONS:
-            return f"Invalid sort '{sort}'. Available: {', '.join(AVAILABLE_SORT_OPTIONS)}"
-        params["sort"] = sort.lower()
+        sort_value = _validate("sort", sort)
+        if sort_value is None:
+            return _invalid("sort", sort)
+        params["sort"] = sort_value
         filters_applied.append(f"Sort: {sort}")
     
-    logger.info(f"Filtering anime with params: {params}")
+    logger.info("Filtering anime with params: %s", params)
     
     data = await make_api_request("/api/filter", params)
     
@@ -740,12 +1113,12 @@ async def filter_anime(
     count = data.get("count", len(anime_list))
     
     filter_summary = ", ".join(filters_applied) if filters_applied else "No filters"
-    result = f"🔍 **Filtered Anime** ({filter_summary})\n"
-    result += f"Page {page}, {count} results\n"
-    result += "=" * 50 + "\n"
-    result += format_anime_list(anime_list)
-    
-    return result
+    return "".join((
+        f"🔍 **Filtered Anime** ({filter_summary})\n",
+        f"Page {page}, {count} results\n",
+        _SEP,
+        format_anime_list(anime_list),
+    ))
 
 
 @mcp.tool()
@@ -766,15 +1139,9 @@ async def check_api_health() -> str:
         return "❌ HiAnime API is not responding. Please try again later."
 
 
-@mcp.tool()
-async def get_available_filters() -> str:
-    """
-    Get all available filter options for the anime search.
-    
-    Returns:
-        A list of all available filter options including genres, types, statuses, etc.
-    """
-    return f"""
+# The filter overview is a pure function of the module constants above,
+# so build the string once at import time instead of on every call
+_AVAILABLE_FILTERS_TEXT = f"""
 📚 **Available Filter Options for HiAnime MCP Server**
 
 🎭 **Genres:**
@@ -808,6 +1175,17 @@ sub, dub
 """
 
 
+@mcp.tool()
+async def get_available_filters() -> str:
+    """
+    Get all available filter options for the anime search.
+
+    Returns:
+        A list of all available filter options including genres, types, statuses, etc.
+    """
+    return _AVAILABLE_FILTERS_TEXT
+
+
 # ============================================================================
 # MYANIMELIST (MAL) TOOLS
 # ============================================================================
@@ -818,6 +1196,31 @@ MAL_RANKING_TYPES = ["all", "airing", "upcoming", "tv", "movie", "bypopularity",
 # Available MAL anime list statuses
 MAL_LIST_STATUSES = ["watching", "completed", "on_hold", "dropped", "plan_to_watch"]
 
+# Frozenset mirrors for O(1) membership, same split as the HiAnime lists
+MAL_RANKING_TYPES_SET = frozenset(MAL_RANKING_TYPES)
+MAL_LIST_STATUSES_SET = frozenset(MAL_LIST_STATUSES)
+
+# Display titles per ranking type, hoisted so mal_ranking doesn't rebuild
+# the dict on every call
+_RANKING_TITLES = {
+    "all": "Top Anime Series",
+    "airing": "Top Airing Anime",
+    "upcoming": "Top Upcoming Anime",
+    "tv": "Top TV Series",
+    "movie": "Top Movies",
+    "bypopularity": "Most Popular",
+    "favorite": "Most Favorited",
+}
+
+# Formatted MAL tool output, keyed by the tool's argument tuple.  These
+# endpoints are effectively static on the minute-to-hour timescale, so a
+# hit skips both the upstream roundtrip and the format pass.  TTLs match
+# how often each dataset actually moves; errors are never cached
+_mal_output_cache = TTLCache(maxsize=256)
+_MAL_DETAILS_TTL = 600.0     # details change rarely
+_MAL_RANKING_TTL = 3600.0    # rankings refresh roughly daily
+_MAL_SEASONAL_TTL = 86400.0  # a season's lineup is static
+
 
 def format_mal_anime_item(item: dict) -> str:
     """Format a single MAL anime item into a readable string."""
@@ -825,84 +1228,29 @@ def format_mal_anime_item(item: dict) -> str:
     
     title = node.get('title', 'Unknown Title')
     mal_id = node.get('id', 'N/A')
-    main_picture = node.get('main_picture', {})
-    picture_url = main_picture.get('medium', main_picture.get('large', ''))
-    
-    # Get ranking info if available
-    ranking = item.get('ranking', {})
-    rank = ranking.get('rank', '')
-    
-    result = f"""
+
+    # Fold the optional rank line into the single f-string so each item
+    # is built in one allocation instead of a build-then-append copy
+    ranking = item.get('ranking') or {}
+    rank = ranking.get('rank')
+    rank_line = f"\n   ▸ Rank: #{rank}" if rank else ""
+
+    return f"""
 📺 **{title}**
    ▸ MAL ID: `{mal_id}` ← Use this for MAL details lookup
-   ▸ MAL URL: https://myanimelist.net/anime/{mal_id}"""
-    
-    if rank:
-        result += f"\n   ▸ Rank: #{rank}"
-    
-    return result
+   ▸ MAL URL: https://myanimelist.net/anime/{mal_id}{rank_line}"""
 
 
 def format_mal_anime_list(data: list[dict]) -> str:
     """Format a list of MAL anime items."""
     if not data:
         return "No anime found."
-    return "\n".join(format_mal_anime_item(item) for item in data)
+    return "\n".join([format_mal_anime_item(item) for item in data])
 
 
-def format_mal_anime_details(data: dict) -> str:
-    """Format detailed MAL anime information."""
-    if not data:
-        return "No details available."
-    
-    title = data.get('title', 'Unknown Title')
-    mal_id = data.get('id', 'N/A')
-    
-    # Basic info
-    media_type = data.get('media_type', 'N/A')
-    status = data.get('status', 'N/A')
-    num_episodes = data.get('num_episodes', 'N/A')
-    
-    # Dates
-    start_date = data.get('start_date', 'N/A')
-    end_date = data.get('end_date', 'N/A')
-    
-    # Scores and popularity
-    mean_score = data.get('mean', 'N/A')
-    rank = data.get('rank', 'N/A')
-    popularity = data.get('popularity', 'N/A')
-    num_scoring_users = data.get('num_scoring_users', 'N/A')
-    num_list_users = data.get('num_list_users', 'N/A')
-    
-    # Synopsis
-    synopsis = data.get('synopsis', 'No synopsis available.')
-    
-    # Genres
-    genres = data.get('genres', [])
-    genre_names = [g.get('name', '') for g in genres] if genres else []
-    
-    # Studios
-    studios = data.get('studios', [])
-    studio_names = [s.get('name', '') for s in studios] if studios else []
-    
-    # Alternative titles
-    alt_titles = data.get('alternative_titles', {})
-    japanese_title = alt_titles.get('ja', 'N/A')
-    english_title = alt_titles.get('en', 'N/A')
-    
-    # Season and year
-    start_season = data.get('start_season', {})
-    season = start_season.get('season', '')
-    year = start_season.get('year', '')
-    season_display = f"{season.title()} {year}" if season and year else 'N/A'
-    
-    # Rating
-    rating = data.get('rating', 'N/A')
-    
-    # Source
-    source = data.get('source', 'N/A')
-    
-    result = f"""
+# Precompiled details template: the literal bytes are parsed once at
+# import instead of being rebuilt by f-string opcodes on every render
+_MAL_DETAILS_TMPL = """
 🎬 **{title}** (MAL)
 
 📝 **Basic Information:**
@@ -927,13 +1275,57 @@ def format_mal_anime_details(data: dict) -> str:
 📖 **Synopsis:**
 {synopsis}
 
-🏷️ **Genres:** {', '.join(genre_names) if genre_names else 'N/A'}
+🏷️ **Genres:** {genres_display}
 
-🎭 **Studios:** {', '.join(studio_names) if studio_names else 'N/A'}
+🎭 **Studios:** {studios_display}
 
 🔗 **MAL URL:** https://myanimelist.net/anime/{mal_id}
 """
-    return result
+
+
+def format_mal_anime_details(data: dict) -> str:
+    """Format detailed MAL anime information."""
+    if not data:
+        return "No details available."
+
+    get = data.get
+
+    genres = get('genres', [])
+    genre_names = [g.get('name', '') for g in genres] if genres else []
+
+    studios = get('studios', [])
+    studio_names = [s.get('name', '') for s in studios] if studios else []
+
+    alt_titles = get('alternative_titles', {})
+
+    start_season = get('start_season', {})
+    season = start_season.get('season', '')
+    year = start_season.get('year', '')
+
+    return _MAL_DETAILS_TMPL.format_map({
+        'title': get('title', 'Unknown Title'),
+        'mal_id': get('id', 'N/A'),
+        'english_title': alt_titles.get('en', 'N/A'),
+        'japanese_title': alt_titles.get('ja', 'N/A'),
+        'media_type': get('media_type', 'N/A'),
+        'status': get('status', 'N/A'),
+        'num_episodes': get('num_episodes', 'N/A'),
+        'season_display': f"{season.title()} {year}" if season and year else 'N/A',
+        'start_date': get('start_date', 'N/A'),
+        'end_date': get('end_date', 'N/A'),
+        'rating': get('rating', 'N/A'),
+        'source': get('source', 'N/A'),
+        'mean_score': get('mean', 'N/A'),
+        'rank': get('rank', 'N/A'),
+        'popularity': get('popularity', 'N/A'),
+        # These two render with a ',' spec, so keep the defaults numeric:
+        # a string fallback would raise ValueError when MAL omits the field
+        'num_scoring_users': get('num_scoring_users', 0) or 0,
+        'num_list_users': get('num_list_users', 0) or 0,
+        'synopsis': get('synopsis', 'No synopsis available.'),
+        'genres_display': ', '.join(genre_names) if genre_names else 'N/A',
+        'studios_display': ', '.join(studio_names) if studio_names else 'N/A',
+    })
 
 
 def format_mal_user_animelist(data: list[dict]) -> str:
@@ -941,26 +1333,28 @@ def format_mal_user_animelist(data: list[dict]) -> str:
     if not data:
         return "No anime in list."
     
-    results = []
-    for item in data[:25]:  # Limit to first 25 for readability
+    limited = data[:25]  # Limit to first 25 for readability
+    # Pre-sized fill-by-index avoids append-driven list resizes
+    results = [""] * len(limited)
+    for i, item in enumerate(limited):
         node = item.get('node', {})
         list_status = item.get('list_status', {})
-        
+
         title = node.get('title', 'Unknown Title')
         mal_id = node.get('id', 'N/A')
         status = list_status.get('status', 'N/A')
         score = list_status.get('score', 0)
         watched_eps = list_status.get('num_episodes_watched', 0)
-        
+
         score_display = f"⭐ {score}/10" if score > 0 else "Not rated"
-        
-        results.append(f"""
+
+        results[i] = f"""
 📺 **{title}**
    ▸ MAL ID: {mal_id}
    ▸ Status: {status.replace('_', ' ').title()}
    ▸ Score: {score_display}
-   ▸ Episodes Watched: {watched_eps}""")
-    
+   ▸ Episodes Watched: {watched_eps}"""
+
     result = "\n".join(results)
     if len(data) > 25:
         result += f"\n\n... and {len(data) - 25} more anime."
@@ -979,7 +1373,7 @@ async def mal_search(query: str, limit: int = 10) -> str:
     Returns:
         A formatted list of anime from MyAnimeList with MAL IDs and scores
     """
-    logger.info(f"MAL search for: {query}, limit: {limit}")
+    logger.info("MAL search for: %s, limit: %s", query, limit)
     
     # Clamp limit to valid range
     limit = max(1, min(100, limit))
@@ -994,11 +1388,7 @@ async def mal_search(query: str, limit: int = 10) -> str:
     if not anime_list:
         return f"No anime found on MAL for '{query}'."
     
-    result = f"🔍 **MAL Search Results for '{query}'** ({len(anime_list)} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_mal_anime_list(anime_list)
-    
-    return result
+    return "".join((f"🔍 **MAL Search Results for '{query}'** ({len(anime_list)} results)\n", _SEP, format_mal_anime_list(anime_list)))
 
 
 @mcp.tool()
@@ -1012,15 +1402,22 @@ async def mal_anime_details(mal_id: int) -> str:
     Returns:
         Detailed information about the anime including scores, rankings, synopsis, etc.
     """
-    logger.info(f"Fetching MAL anime details for ID: {mal_id}")
-    
+    cache_key = ("details", mal_id)
+    cached = _mal_output_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    logger.info("Fetching MAL anime details for ID: %s", mal_id)
+
     data = await make_api_request(f"/api/mal/anime/{mal_id}")
-    
+
     if not data or not data.get("success"):
         return f"Unable to fetch MAL details for anime ID '{mal_id}'. Please check the ID and try again."
-    
+
     anime_data = data.get("data", {})
-    return format_mal_anime_details(anime_data)
+    result = format_mal_anime_details(anime_data)
+    _mal_output_cache.set(cache_key, result, _MAL_DETAILS_TTL)
+    return result
 
 
 @mcp.tool()
@@ -1042,18 +1439,23 @@ async def mal_ranking(ranking_type: str = "all", limit: int = 10) -> str:
     Returns:
         A formatted list of top ranked anime from MAL
     """
-    ranking_lower = ranking_type.lower().strip()
-    
-    if ranking_lower not in MAL_RANKING_TYPES:
+    ranking_lower = _norm(ranking_type, MAL_RANKING_TYPES_SET)
+
+    if ranking_lower is None:
         return f"Invalid ranking type '{ranking_type}'. Available types: {', '.join(MAL_RANKING_TYPES)}"
     
     # Clamp limit to valid range
     limit = max(1, min(100, limit))
-    
-    logger.info(f"Fetching MAL rankings: type={ranking_lower}, limit={limit}")
-    
+
+    cache_key = ("ranking", ranking_lower, limit)
+    cached = _mal_output_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    logger.info("Fetching MAL rankings: type=%s, limit=%s", ranking_lower, limit)
+
     data = await make_api_request("/api/mal/ranking", {"type": ranking_lower, "limit": limit})
-    
+
     if not data or not data.get("success"):
         return f"Unable to fetch MAL rankings. Please try again later."
     
@@ -1062,22 +1464,9 @@ async def mal_ranking(ranking_type: str = "all", limit: int = 10) -> str:
     if not anime_list:
         return "No rankings available."
     
-    # Format ranking titles
-    ranking_titles = {
-        "all": "Top Anime Series",
-        "airing": "Top Airing Anime",
-        "upcoming": "Top Upcoming Anime",
-        "tv": "Top TV Series",
-        "movie": "Top Movies",
-        "bypopularity": "Most Popular",
-        "favorite": "Most Favorited"
-    }
-    
-    title = ranking_titles.get(ranking_lower, "Rankings")
-    result = f"🏆 **MAL {title}** (Top {len(anime_list)})\n"
-    result += "=" * 50 + "\n"
-    result += format_mal_anime_list(anime_list)
-    
+    title = _RANKING_TITLES.get(ranking_lower, "Rankings")
+    result = "".join((f"🏆 **MAL {title}** (Top {len(anime_list)})\n", _SEP, format_mal_anime_list(anime_list)))
+    _mal_output_cache.set(cache_key, result, _MAL_RANKING_TTL)
     return result
 
 
@@ -1098,15 +1487,20 @@ async def mal_seasonal(year: int, season: str, limit: int = 10) -> str:
     Returns:
         A formatted list of anime from the specified season
     """
-    season_lower = season.lower().strip()
-    
-    if season_lower not in AVAILABLE_SEASONS:
+    season_lower = _norm(season, AVAILABLE_SEASONS_SET)
+
+    if season_lower is None:
         return f"Invalid season '{season}'. Available seasons: {', '.join(AVAILABLE_SEASONS)}"
     
     # Clamp limit to valid range
     limit = max(1, min(100, limit))
-    
-    logger.info(f"Fetching MAL seasonal anime: {season_lower} {year}, limit={limit}")
+
+    cache_key = ("seasonal", year, season_lower, limit)
+    cached = _mal_output_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    logger.info("Fetching MAL seasonal anime: %s %s, limit=%s", season_lower, year, limit)
     
     data = await make_api_request("/api/mal/seasonal", {
         "year": year,
@@ -1120,12 +1514,13 @@ async def mal_seasonal(year: int, season: str, limit: int = 10) -> str:
     anime_list = data.get("data", [])
     
     if not anime_list:
-        return f"No anime found for {season.title()} {year}."
-    
-    result = f"🍂 **MAL {season.title()} {year} Anime** ({len(anime_list)} results)\n"
-    result += "=" * 50 + "\n"
-    result += format_mal_anime_list(anime_list)
-    
+        return f"No anime found for {season_lower.title()} {year}."
+
+    # Header must come from the normalized value: the result is cached
+    # under season_lower, so raw input like " FALL " would otherwise be
+    # baked into the entry served to later callers
+    result = "".join((f"🍂 **MAL {season_lower.title()} {year} Anime** ({len(anime_list)} results)\n", _SEP, format_mal_anime_list(anime_list)))
+    _mal_output_cache.set(cache_key, result, _MAL_SEASONAL_TTL)
     return result
 
 
@@ -1151,42 +1546,87 @@ async def combined_search(query: str, limit: int = 5) -> str:
     """
     # Clamp limit to valid range
     limit = max(1, min(20, limit))
-    
-    logger.info(f"Combined search for: {query}, limit: {limit}")
-    
-    data = await make_api_request("/api/combined/search", {"query": query, "limit": limit})
-    
-    if not data or not data.get("success"):
+
+    logger.info("Combined search for: %s, limit: %s", query, limit)
+
+    # Query both upstreams concurrently instead of going through the
+    # backend's serial /api/combined/search: wall time becomes the max of
+    # the two roundtrips, and either side can fail independently
+    hianime_data, mal_data = await asyncio.gather(
+        make_api_request("/api/search", {"keyword": query}),
+        make_api_request("/api/mal/search", {"query": query, "limit": limit}),
+    )
+
+    # make_api_request returns None (never raises) on failure; a 200 with
+    # success=false is a backend-reported failure, not an empty result set
+    hianime_ok = bool(hianime_data and hianime_data.get("success"))
+    mal_ok = bool(mal_data and mal_data.get("success"))
+
+    if not hianime_ok and not mal_ok:
         return f"Unable to perform combined search for '{query}'. Please try again later."
-    
-    result_data = data.get("data", {})
-    hianime_results = result_data.get("hianime", [])
-    mal_results = result_data.get("mal", [])
-    
-    result = f"🔍 **Combined Search Results for '{query}'**\n"
-    result += "=" * 50 + "\n"
-    
+
+    hianime_results = (hianime_data.get("data") or [])[:limit] if hianime_ok else []
+    mal_results = (mal_data.get("data") or []) if mal_ok else []
+
+    parts = [f"🔍 **Combined Search Results for '{query}'**\n", _SEP]
+
     # HiAnime results
-    result += "\n📺 **HiAnime Results:**\n"
+    parts.append("\n📺 **HiAnime Results:**\n")
     if hianime_results:
-        result += format_anime_list(hianime_results)
+        parts.append(format_anime_list(hianime_results))
+    elif hianime_ok:
+        parts.append("   No results from HiAnime.\n")
     else:
-        result += "   No results from HiAnime.\n"
-    
+        parts.append("   HiAnime unavailable. Please try again later.\n")
+
     # MAL results
-    result += "\n\n📊 **MyAnimeList Results:**\n"
+    parts.append("\n\n📊 **MyAnimeList Results:**\n")
     if mal_results:
-        result += format_mal_anime_list(mal_results)
+        parts.append(format_mal_anime_list(mal_results))
+    elif mal_ok:
+        parts.append("   No results from MAL.\n")
     else:
-        result += "   No results from MAL.\n"
-    
-    return result
+        parts.append("   MAL unavailable. Please try again later.\n")
+
+    return "".join(parts)
 
 
 # ============================================================================
 # MYANIMELIST USER AUTHENTICATION TOOLS
 # ============================================================================
 
+# Backoff delays between attempts for the MAL POST endpoints; shorter
+# than the GET path's retry cycle since these calls carry credentials
+_POST_BACKOFF = (0.1, 0.3)
+
+
+async def _post_json(endpoint: str, payload: dict) -> dict[str, Any]:
+    """POST a JSON payload through the shared client and parse the response.
+
+    Retries on 5xx responses and transport errors with a short backoff;
+    the final failure propagates so the caller can report its own
+    tool-specific error message.
+    """
+    client = _get_client()
+    for delay in _POST_BACKOFF + (None,):
+        try:
+            response = await client.post(
+                endpoint,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            )
+            if delay is not None and response.status_code in _RETRY_STATUS_CODES:
+                await asyncio.sleep(delay)
+                continue
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.TransportError:
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
 @mcp.tool()
 async def mal_get_auth_url(client_id: str, redirect_uri: str, client_secret: Optional[str] = None) -> str:
     """
@@ -1208,36 +1648,23 @@ async def mal_get_auth_url(client_id: str, redirect_uri: str, client_secret: Opt
         Authorization URL to open in browser, and code_verifier to save for token exchange
     """
     logger.info("Getting MAL OAuth2 authorization URL")
-    
-    payload = {
+
+    # The PKCE parameters are standard crypto we can produce locally -
+    # no need to pay a backend roundtrip just to template a URL.  MAL
+    # only supports the 'plain' challenge method, so challenge == verifier
+    code_verifier = secrets.token_urlsafe(64)[:128]
+    state = secrets.token_urlsafe(16)
+
+    query = urlencode({
+        "response_type": "code",
         "client_id": client_id,
-        "redirect_uri": redirect_uri
-    }
-    if client_secret:
-        payload["client_secret"] = client_secret
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{HIANIME_API_BASE}/api/mal/user/auth",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
-        except Exception as e:
-            logger.error(f"Failed to get auth URL: {str(e)}")
-            return f"Unable to get authorization URL. Error: {str(e)}"
-    
-    if not data or not data.get("success"):
-        return "Unable to get authorization URL. Please check your credentials and try again."
-    
-    auth_data = data.get("data", {})
-    auth_url = auth_data.get("auth_url", "")
-    code_verifier = auth_data.get("code_verifier", "")
-    state = auth_data.get("state", "")
-    
+        "redirect_uri": redirect_uri,
+        "code_challenge": code_verifier,
+        "code_challenge_method": "plain",
+        "state": state,
+    })
+    auth_url = f"https://myanimelist.net/v1/oauth2/authorize?{query}"
+
     return f"""
 🔐 **MAL OAuth2 Authorization**
 
@@ -1290,19 +1717,11 @@ async def mal_exchange_token(
     if client_secret:
         payload["client_secret"] = client_secret
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{HIANIME_API_BASE}/api/mal/user/token",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
-        except Exception as e:
-            logger.error(f"Failed to exchange token: {str(e)}")
-            return f"Unable to exchange token. Error: {str(e)}"
+    try:
+        data = await _post_json("/api/mal/user/token", payload)
+    except Exception as e:
+        logger.error("Failed to exchange token: %s", e)
+        return f"Unable to exchange token. Error: {str(e)}"
     
     if not data or not data.get("success"):
         return "Unable to exchange token. Please check your credentials and try again."
@@ -1359,32 +1778,25 @@ async def mal_user_animelist(
     Returns:
         User's anime list with watch status, scores, and progress
     """
-    logger.info(f"Fetching MAL user animelist, status={status}, limit={limit}")
+    logger.info("Fetching MAL user animelist, status=%s, limit=%s", status, limit)
     
-    if status and status.lower() not in MAL_LIST_STATUSES:
+    status_value = _norm(status, MAL_LIST_STATUSES_SET) if status else None
+    if status and status_value is None:
         return f"Invalid status '{status}'. Available statuses: {', '.join(MAL_LIST_STATUSES)}"
-    
+
     payload = {
         "client_id": client_id,
         "access_token": access_token,
         "limit": limit
     }
-    if status:
-        payload["status"] = status.lower()
+    if status_value:
+        payload["status"] = status_value
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{HIANIME_API_BASE}/api/mal/user/animelist",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
-        except Exception as e:
-            logger.error(f"Failed to fetch animelist: {str(e)}")
-            return f"Unable to fetch anime list. Error: {str(e)}"
+    try:
+        data = await _post_json("/api/mal/user/animelist", payload)
+    except Exception as e:
+        logger.error("Failed to fetch animelist: %s", e)
+        return f"Unable to fetch anime list. Error: {str(e)}"
     
     if not data or not data.get("success"):
         return "Unable to fetch anime list. Please check your credentials and try again."
@@ -1396,11 +1808,51 @@ async def mal_user_animelist(
         return f"No anime found in your list{status_msg}."
     
     status_title = status.replace('_', ' ').title() if status else "All"
-    result = f"📚 **Your MAL Anime List** ({status_title}, {len(anime_list)} entries)\n"
-    result += "=" * 50 + "\n"
-    result += format_mal_user_animelist(anime_list)
-    
-    return result
+    return "".join((f"📚 **Your MAL Anime List** ({status_title}, {len(anime_list)} entries)\n", _SEP, format_mal_user_animelist(anime_list)))
+
+
+# Precompiled profile template, parsed once at import like the MAL
+# details template
+_PROFILE_TMPL = """
+👤 **MAL User Profile**
+
+📝 **Basic Information:**
+   - Username: {username}
+   - User ID: {user_id}
+   - Location: {location}
+   - Birthday: {birthday}
+   - Joined: {joined}
+
+📊 **Anime Statistics:**
+   - Total Entries: {total_entries}
+   - Episodes Watched: {episodes_watched:,}
+   - Days Watched: {days_watched:.1f}
+   - Mean Score: {mean_score}/10
+
+📈 **Status Breakdown:**
+   - 📺 Watching: {num_watching}
+   - ✅ Completed: {num_completed}
+   - ⏸️ On Hold: {num_on_hold}
+   - ❌ Dropped: {num_dropped}
+   - 📋 Plan to Watch: {num_plan_to_watch}
+
+🔗 **Profile URL:** https://myanimelist.net/profile/{username}
+"""
+
+# anime_statistics fields in template order; merging over the defaults
+# and extracting with one itemgetter call replaces nine dict.get probes
+_STATS_DEFAULTS = {
+    "num_items": 0,
+    "num_episodes": 0,
+    "num_days_watched": 0,
+    "mean_score": 0,
+    "num_items_watching": 0,
+    "num_items_completed": 0,
+    "num_items_on_hold": 0,
+    "num_items_dropped": 0,
+    "num_items_plan_to_watch": 0,
+}
+_STATS_GETTER = itemgetter(*_STATS_DEFAULTS)
 
 
 @mcp.tool()
@@ -1424,73 +1876,139 @@ async def mal_user_profile(client_id: str, access_token: str) -> str:
         "access_token": access_token
     }
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{HIANIME_API_BASE}/api/mal/user/profile",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
-        except Exception as e:
-            logger.error(f"Failed to fetch profile: {str(e)}")
-            return f"Unable to fetch profile. Error: {str(e)}"
+    try:
+        data = await _post_json("/api/mal/user/profile", payload)
+    except Exception as e:
+        logger.error("Failed to fetch profile: %s", e)
+        return f"Unable to fetch profile. Error: {str(e)}"
     
     if not data or not data.get("success"):
         return "Unable to fetch profile. Please check your credentials and try again."
     
     profile = data.get("data", {})
-    
-    username = profile.get("name", "Unknown")
-    user_id = profile.get("id", "N/A")
-    location = profile.get("location", "N/A")
-    joined = profile.get("joined_at", "N/A")
-    birthday = profile.get("birthday", "N/A")
-    
-    # Anime statistics
-    anime_stats = profile.get("anime_statistics", {})
-    num_watching = anime_stats.get("num_items_watching", 0)
-    num_completed = anime_stats.get("num_items_completed", 0)
-    num_on_hold = anime_stats.get("num_items_on_hold", 0)
-    num_dropped = anime_stats.get("num_items_dropped", 0)
-    num_plan_to_watch = anime_stats.get("num_items_plan_to_watch", 0)
-    total_entries = anime_stats.get("num_items", 0)
-    episodes_watched = anime_stats.get("num_episodes", 0)
-    mean_score = anime_stats.get("mean_score", 0)
-    days_watched = anime_stats.get("num_days_watched", 0)
-    
-    return f"""
-👤 **MAL User Profile**
 
-📝 **Basic Information:**
-   - Username: {username}
-   - User ID: {user_id}
-   - Location: {location}
-   - Birthday: {birthday}
-   - Joined: {joined}
+    # Pull anime_statistics once and extract every numeric field in a
+    # single itemgetter call over the defaults-merged dict
+    stats = profile.get("anime_statistics") or {}
+    (total_entries, episodes_watched, days_watched, mean_score,
+     num_watching, num_completed, num_on_hold, num_dropped,
+     num_plan_to_watch) = _STATS_GETTER({**_STATS_DEFAULTS, **stats})
+
+    return _PROFILE_TMPL.format_map({
+        "username": profile.get("name", "Unknown"),
+        "user_id": profile.get("id", "N/A"),
+        "location": profile.get("location", "N/A"),
+        "birthday": profile.get("birthday", "N/A"),
+        "joined": profile.get("joined_at", "N/A"),
+        "total_entries": total_entries,
+        "episodes_watched": episodes_watched,
+        "days_watched": days_watched,
+        "mean_score": mean_score,
+        "num_watching": num_watching,
+        "num_completed": num_completed,
+        "num_on_hold": num_on_hold,
+        "num_dropped": num_dropped,
+        "num_plan_to_watch": num_plan_to_watch,
+    })
 
-📊 **Anime Statistics:**
-   - Total Entries: {total_entries}
-   - Episodes Watched: {episodes_watched:,}
-   - Days Watched: {days_watched:.1f}
-   - Mean Score: {mean_score}/10
 
-📈 **Status Breakdown:**
-   - 📺 Watching: {num_watching}
-   - ✅ Completed: {num_completed}
-   - ⏸️ On Hold: {num_on_hold}
-   - ❌ Dropped: {num_dropped}
-   - 📋 Plan to Watch: {num_plan_to_watch}
+# ============================================================================
+# BATCH TOOLS
+# ============================================================================
 
-🔗 **Profile URL:** https://myanimelist.net/profile/{username}
-"""
+# Read-only tools that batch_fetch may dispatch. The MAL auth/user tools
+# are deliberately excluded because they carry credentials.
+_TOOL_REGISTRY = {
+    "search_anime": search_anime,
+    "search_anime_ndjson": search_anime_ndjson,
+    "get_popular_anime": get_popular_anime,
+    "get_top_airing_anime": get_top_airing_anime,
+    "get_recently_updated_anime": get_recently_updated_anime,
+    "get_completed_anime": get_completed_anime,
+    "get_subbed_anime": get_subbed_anime,
+    "get_dubbed_anime": get_dubbed_anime,
+    "get_anime_by_genre": get_anime_by_genre,
+    "get_anime_by_type": get_anime_by_type,
+    "get_anime_details": get_anime_details,
+    "get_anime_episodes": get_anime_episodes,
+    "get_anime_overview": get_anime_overview,
+    "get_episode_info": get_episode_info,
+    "get_anime_az_list": get_anime_az_list,
+    "get_anime_by_producer": get_anime_by_producer,
+    "filter_anime": filter_anime,
+    "check_api_health": check_api_health,
+    "get_available_filters": get_available_filters,
+    "mal_search": mal_search,
+    "mal_anime_details": mal_anime_details,
+    "mal_ranking": mal_ranking,
+    "mal_seasonal": mal_seasonal,
+    "combined_search": combined_search,
+}
+
+
+@mcp.tool()
+async def batch_fetch(calls: list[dict]) -> str:
+    """
+    Run several read-only tools concurrently in a single call.
+
+    Useful when you need multiple fetches at once (e.g. details for
+    several slugs, or pages 1-3 of popular anime): one MCP round-trip
+    issues all requests concurrently over the shared HTTP client.
+
+    Args:
+        calls: A list of {"tool": str, "args": dict} entries, e.g.
+               [{"tool": "search_anime", "args": {"keyword": "naruto"}},
+                {"tool": "get_popular_anime", "args": {"page": 1}}]
+
+    Returns:
+        The results of all calls in order, separated by dividers
+    """
+    if not calls:
+        return "No calls provided."
+
+    # Validate every entry before creating any coroutine, so an early
+    # return can't leave already-created coroutines un-awaited
+    validated = []
+    for i, call in enumerate(calls):
+        if not isinstance(call, dict):
+            return f"Invalid call at index {i}: expected an object with 'tool' and 'args'."
+        tool_name = call.get("tool")
+        args = call.get("args", {})
+        func = _TOOL_REGISTRY.get(tool_name)
+        if func is None:
+            return (f"Invalid call at index {i}: unknown tool '{tool_name}'. "
+                    f"Available tools: {', '.join(sorted(_TOOL_REGISTRY))}")
+        if not isinstance(args, dict):
+            return f"Invalid call at index {i}: 'args' must be an object."
+        validated.append((i, tool_name, func, args))
+
+    coros = []
+    for i, tool_name, func, args in validated:
+        try:
+            coros.append(func(**args))
+        except TypeError as e:
+            # Bad argument names only surface at creation time; close the
+            # coroutines built so far instead of leaking them
+            for coro in coros:
+                coro.close()
+            return f"Invalid arguments for '{tool_name}' at index {i}: {str(e)}"
+
+    logger.info("Batch fetching %s tool calls", len(coros))
+
+    results = await asyncio.gather(*coros, return_exceptions=True)
+
+    sections = []
+    for call, result in zip(calls, results):
+        body = f"Tool failed: {result}" if isinstance(result, BaseException) else result
+        sections.append(f"▶️ **{call.get('tool')}**\n{body}")
+
+    return ("\n\n" + _SEP).join(sections)
 
 
 def main():
     """Initialize and run the MCP server."""
     logger.info("Starting HiAnime MCP Server...")
+    _get_client()  # Warm the shared HTTP client before serving requests
     mcp.run(transport="stdio")
 
 